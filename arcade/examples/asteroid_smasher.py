@@ -95,8 +95,8 @@ def update(self):
         if self.speed < -self.max_speed:
             self.speed = -self.max_speed
 
-        self.change_x = -math.sin(math.radians(self.angle)) * self.speed
-        self.change_y = math.cos(math.radians(self.angle)) * self.speed
+        self.change_x = -math.sin(self.radians) * self.speed
+        self.change_y = math.cos(self.radians) * self.speed
 
         self.center_x += self.change_x
         self.center_y += self.change_y
@@ -247,9 +247,9 @@ def on_key_press(self, symbol, modifiers):
 
             bullet_speed = 13
             bullet_sprite.change_y = \
-                math.cos(math.radians(self.player_sprite.angle)) * bullet_speed
+                math.cos(self.player_sprite.radians) * bullet_speed
             bullet_sprite.change_x = \
-                -math.sin(math.radians(self.player_sprite.angle)) \
+                -math.sin(self.player_sprite.radians) \
                 * bullet_speed
 
             bullet_sprite.center_x = self.player_sprite.center_x
@@ -103,6 +103,11 @@ def _check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     if distance > collision_radius_sum * collision_radius_sum:
         return False
 
+    min_x1, min_y1, max_x1, max_y1 = sprite1.aabb
+    min_x2, min_y2, max_x2, max_y2 = sprite2.aabb
+    if max_x1 <= min_x2 or max_x2 <= min_x1 or max_y1 <= min_y2 or max_y2 <= min_y1:
+        return False
+
     return are_polygons_intersecting(sprite1.points, sprite2.points)
 
 
@@ -17,7 +17,6 @@
 from arcade.draw_commands import load_texture
 from arcade.draw_commands import draw_texture_rectangle
 from arcade.draw_commands import Texture
-from arcade.draw_commands import rotate_point
 from arcade.arcade_types import RGB, Point
 
 from typing import Sequence
@@ -34,6 +33,8 @@ class Sprite:
     Class that represents a 'sprite' on-screen.
 
     Attributes:
+        :aabb: Axis-aligned bounding box of the sprite, as \
+        (min_x, min_y, max_x, max_y).
         :alpha: Transparency of sprite. 0 is invisible, 255 is opaque.
         :angle: Rotation angle in degrees.
         :radians: Rotation angle in radians.
@@ -82,6 +83,18 @@ class Sprite:
 
     """
 
+    # '__dict__' is kept so custom attributes can still be set on a sprite.
+    # Python only creates it the first time one is, so most sprites never
+    # pay for it.
+    __slots__ = ('sprite_lists', 'textures', '_texture', '_width', '_height',
+                 'cur_texture_index', '_scale', '_position', '_angle', '_radians', '_cos_angle', '_sin_angle',
+                 'velocity', 'change_angle',
+                 'boundary_left', 'boundary_right', 'boundary_top', 'boundary_bottom',
+                 'properties', '_alpha', '_collision_radius', '_color',
+                 '_points', '_point_list_cache', '_aabb_cache',
+                 'force', 'guid', 'repeat_count_x', 'repeat_count_y',
+                 '__dict__', '__weakref__')
+
     def __init__(self,
                  filename: str = None,
                  scale: float = 1,
@@ -137,6 +150,9 @@ def __init__(self,
         self._scale = scale
         self._position = [center_x, center_y]
         self._angle = 0.0
+        self._radians = 0.0
+        self._cos_angle = 1.0
+        self._sin_angle = 0.0
 
         self.velocity = [0.0, 0.0]
         self.change_angle = 0
@@ -154,6 +170,7 @@ def __init__(self,
 
         self._points = None
         self._point_list_cache = None
+        self._aabb_cache = None
 
         self.force = [0, 0]
         self.guid = None
@@ -214,15 +231,18 @@ def set_points(self, points: Sequence[Sequence[float]]):
         """
         Set a sprite's position
         """
+        self.clear_spatial_hashes()
         self._points = points
+        self._point_list_cache = None
+        self.add_spatial_hashes()
 
     def forward(self, speed: float = 1.0):
         """
         Set a Sprite's position to speed by its angle
         :param speed: speed factor
         """
-        self.change_x += math.cos(self.radians) * speed
-        self.change_y += math.sin(self.radians) * speed
+        self.change_x += self._cos_angle * speed
+        self.change_y += self._sin_angle * speed
 
     def reverse(self, speed: float = 1.0):
         self.forward(-speed)
@@ -232,8 +252,8 @@ def strafe(self, speed: float = 1.0):
         Set a sprites position perpendicular to its angle by speed
         :param speed: speed factor
         """
-        self.change_x += -math.sin(self.radians) * speed
-        self.change_y += math.cos(self.radians) * speed
+        self.change_x += -self._sin_angle * speed
+        self.change_y += self._cos_angle * speed
 
     def turn_right(self, theta: float = 90):
         self.angle -= theta
@@ -263,34 +283,59 @@ def get_points(self) -> Tuple[Tuple[float, float], ...]:
                          self._points[point][1] + self.center_y)
                 point_list.append(point)
             self._point_list_cache = tuple(point_list)
+        elif self._angle == 0:
+            # Axis-aligned, no rotation needed.
+            center_x, center_y = self._position
+            half_width = self._width / 2
+            half_height = self._height / 2
+            self._point_list_cache = ((center_x - half_width, center_y - half_height),
+                                      (center_x + half_width, center_y - half_height),
+                                      (center_x + half_width, center_y + half_height),
+                                      (center_x - half_width, center_y + half_height))
         else:
-            x1, y1 = rotate_point(self.center_x - self.width / 2,
-                                  self.center_y - self.height / 2,
-                                  self.center_x,
-                                  self.center_y,
-                                  self.angle)
-            x2, y2 = rotate_point(self.center_x + self.width / 2,
-                                  self.center_y - self.height / 2,
-                                  self.center_x,
-                                  self.center_y,
-                                  self.angle)
-            x3, y3 = rotate_point(self.center_x + self.width / 2,
-                                  self.center_y + self.height / 2,
-                                  self.center_x,
-                                  self.center_y,
-                                  self.angle)
-            x4, y4 = rotate_point(self.center_x - self.width / 2,
-                                  self.center_y + self.height / 2,
-                                  self.center_x,
-                                  self.center_y,
-                                  self.angle)
-
-            self._point_list_cache = ((x1, y1), (x2, y2), (x3, y3), (x4, y4))
+            # The angle's cos/sin are kept up to date by the angle setter,
+            # so each corner only needs a few multiplies.
+            center_x, center_y = self._position
+            half_width = self._width / 2
+            half_height = self._height / 2
+            cos_angle = self._cos_angle
+            sin_angle = self._sin_angle
+
+            point_list = []
+            for x, y in ((-half_width, -half_height),
+                         (half_width, -half_height),
+                         (half_width, half_height),
+                         (-half_width, half_height)):
+                point = (round(center_x + x * cos_angle - y * sin_angle, 2),
+                         round(center_y + x * sin_angle + y * cos_angle, 2))
+                point_list.append(point)
+            self._point_list_cache = tuple(point_list)
+
+        # Keep the axis-aligned bounding box in step with the points, so the
+        # edge properties and broad-phase checks don't need to scan them.
+        if self._points is None and self._angle == 0:
+            (min_x, min_y), _, (max_x, max_y), _ = self._point_list_cache
+        else:
+            x_list = [point[0] for point in self._point_list_cache]
+            y_list = [point[1] for point in self._point_list_cache]
+            min_x, min_y, max_x, max_y = min(x_list), min(y_list), max(x_list), max(y_list)
+        self._aabb_cache = (min_x, min_y, max_x, max_y)
 
         return self._point_list_cache
 
     points = property(get_points, set_points)
 
+    def _get_aabb(self) -> Tuple[float, float, float, float]:
+        """
+        Get the axis-aligned bounding box of the sprite as
+        (min_x, min_y, max_x, max_y).
+        """
+        if self._point_list_cache is None:
+            self.get_points()
+        return self._aabb_cache
+
+    aabb = property(_get_aabb)
+
     def _set_collision_radius(self, collision_radius: float):
         """
         Set the collision radius.
@@ -349,11 +394,10 @@ def _get_bottom(self) -> float:
         """
         Return the y coordinate of the bottom of the sprite.
         """
-        points = self.get_points()
-        my_min = points[0][1]
-        for point in range(1, len(points)):
-            my_min = min(my_min, points[point][1])
-        return my_min
+        if self._points is None and self._angle == 0:
+            return self._position[1] - self._height / 2
+
+        return self._get_aabb()[1]
 
     def _set_bottom(self, amount: float):
         """
@@ -369,11 +413,10 @@ def _get_top(self) -> float:
         """
         Return the y coordinate of the top of the sprite.
         """
-        points = self.get_points()
-        my_max = points[0][1]
-        for i in range(1, len(points)):
-            my_max = max(my_max, points[i][1])
-        return my_max
+        if self._points is None and self._angle == 0:
+            return self._position[1] + self._height / 2
+
+        return self._get_aabb()[3]
 
     def _set_top(self, amount: float):
         """ The highest y coordinate. """
@@ -506,6 +549,9 @@ def _set_angle(self, new_value: float):
         if new_value != self._angle:
             self.clear_spatial_hashes()
             self._angle = new_value
+            self._radians = math.radians(new_value)
+            self._cos_angle = math.cos(self._radians)
+            self._sin_angle = math.sin(self._radians)
             self._point_list_cache = None
             self.add_spatial_hashes()
 
@@ -516,16 +562,17 @@ def _set_angle(self, new_value: float):
 
     def _to_radians(self) -> float:
         """
-        Converts the degrees representation of self.angle into radians.
+        Returns the angle in radians. This is kept up to date when the
+        angle is set, so it isn't converted on every call.
         :return: float
         """
-        return self.angle / 180.0 * math.pi
+        return self._radians
 
     def _from_radians(self, new_value: float):
         """
         Converts a radian value into degrees and stores it into angle.
         """
-        self.angle = new_value * 180.0 / math.pi
+        self.angle = math.degrees(new_value)
 
     radians = property(_to_radians, _from_radians)
 
@@ -533,11 +580,10 @@ def _get_left(self) -> float:
         """
         Left-most coordinate.
         """
-        points = self.get_points()
-        my_min = points[0][0]
-        for i in range(1, len(points)):
-            my_min = min(my_min, points[i][0])
-        return my_min
+        if self._points is None and self._angle == 0:
+            return self._position[0] - self._width / 2
+
+        return self._get_aabb()[0]
 
     def _set_left(self, amount: float):
         """ The left most x coordinate. """
@@ -551,12 +597,10 @@ def _get_right(self) -> float:
         """
         Return the x coordinate of the right-side of the sprite.
         """
+        if self._points is None and self._angle == 0:
+            return self._position[0] + self._width / 2
 
-        points = self.get_points()
-        my_max = points[0][0]
-        for point in range(1, len(points)):
-            my_max = max(my_max, points[point][0])
-        return my_max
+        return self._get_aabb()[2]
 
     def _set_right(self, amount: float):
         """ The right most x coordinate. """
@@ -572,31 +616,27 @@ def set_texture(self, texture_no: int):
         a number rather than a texture, but keeping
         this for backwards compatibility.
         """
-        if self.textures[texture_no] == self._texture:
-            return
-
-        texture = self.textures[texture_no]
-        self.clear_spatial_hashes()
-        self._point_list_cache = None
-        self._texture = texture
-        self._width = texture.width * texture.scale
-        self._height = texture.height * texture.scale
-        self.add_spatial_hashes()
-        for sprite_list in self.sprite_lists:
-            sprite_list.update_texture(self)
+        self._set_texture2(self.textures[texture_no])
 
     def _set_texture2(self, texture: Texture):
         """ Sets texture by texture id. Should be renamed but keeping
         this for backwards compatibility. """
-        if texture == self._texture:
+        if texture is self._texture:
             return
 
-        self.clear_spatial_hashes()
-        self._point_list_cache = None
         self._texture = texture
-        self._width = texture.width * texture.scale
-        self._height = texture.height * texture.scale
-        self.add_spatial_hashes()
+
+        # Animation frames are usually all the same size, in which case the
+        # outline, and so the cached points and spatial hash, stay valid.
+        width = texture.width * texture.scale
+        height = texture.height * texture.scale
+        if width != self._width or height != self._height:
+            self.clear_spatial_hashes()
+            self._point_list_cache = None
+            self._width = width
+            self._height = height
+            self.add_spatial_hashes()
+
         for sprite_list in self.sprite_lists:
             sprite_list.update_texture(self)
 
@@ -615,6 +655,9 @@ def _set_color(self, color: RGB):
         """
         Set the current sprite color as a RGB value
         """
+        if color == self._color:
+            return
+
         self._color = color
         for sprite_list in self.sprite_lists:
             sprite_list.update_position(self)
@@ -631,6 +674,9 @@ def _set_alpha(self, alpha: int):
         """
         Set the current sprite color as a value
         """
+        if alpha == self._alpha:
+            return
+
         self._alpha = alpha
         for sprite_list in self.sprite_lists:
             sprite_list.update_position(self)
@@ -641,8 +687,10 @@ def register_sprite_list(self, new_list):
         """
         Register this sprite as belonging to a list. We will automatically
         remove ourselves from the the list when kill() is called.
+        Registering the same list more than once has no effect.
         """
-        self.sprite_lists.append(new_list)
+        if new_list not in self.sprite_lists:
+            self.sprite_lists.append(new_list)
 
     def draw(self):
         """ Draw the sprite. """
@@ -672,10 +720,8 @@ def remove_from_sprite_lists(self):
         """
         Remove the sprite from all sprite lists.
         """
-        for sprite_list in self.sprite_lists:
-            if self in sprite_list:
-                sprite_list.remove(self)
-        self.sprite_lists.clear()
+        for sprite_list in self.sprite_lists[:]:
+            sprite_list.remove(self)
 
     def kill(self):
         """
@@ -732,6 +778,8 @@ class AnimatedTimeSprite(Sprite):
     Sprite for platformer games that supports animations.
     """
 
+    __slots__ = ('state', 'texture_change_frames', 'frame')
+
     def __init__(self, scale: float = 1,
                  image_x: float = 0, image_y: float = 0,
                  center_x: float = 0, center_y: float = 0):
@@ -767,6 +815,8 @@ class AnimatedTimeBasedSprite(Sprite):
     Sprite for platformer games that supports animations.
     """
 
+    __slots__ = ('cur_frame', 'frames', 'time_counter')
+
     def __init__(self,
                  filename: str = None,
                  scale: float = 1,
@@ -787,12 +837,16 @@ def update_animation(self, delta_time: float = 1/60):
         Logic for selecting the proper texture to use.
         """
         self.time_counter += delta_time
-        while self.time_counter > self.frames[self.cur_frame].duration / 1000.0:
-            self.time_counter -= self.frames[self.cur_frame].duration / 1000.0
+        frame_count = len(self.frames)
+        frame_duration = self.frames[self.cur_frame].duration / 1000.0
+        while self.time_counter > frame_duration:
+            self.time_counter -= frame_duration
             self.cur_frame += 1
-            if self.cur_frame >= len(self.frames):
+            if self.cur_frame >= frame_count:
                 self.cur_frame = 0
-            source = self.frames[self.cur_frame].image.source
+            frame = self.frames[self.cur_frame]
+            frame_duration = frame.duration / 1000.0
+            source = frame.image.source
             # print(f"Advance to frame {self.cur_frame}: {source}")
             self.texture = load_texture(source, scale=self.scale)
 
@@ -802,6 +856,12 @@ class AnimatedWalkingSprite(Sprite):
     Sprite for platformer games that supports animations.
     """
 
+    __slots__ = ('state', 'stand_right_textures', 'stand_left_textures',
+                 'walk_left_textures', 'walk_right_textures',
+                 'walk_up_textures', 'walk_down_textures',
+                 'texture_change_distance',
+                 'last_texture_change_center_x', 'last_texture_change_center_y')
+
     def __init__(self, scale: float = 1,
                  image_x: float = 0, image_y: float = 0,
                  center_x: float = 0, center_y: float = 0):
@@ -827,7 +887,8 @@ def update_animation(self, delta_time: float = 1/60):
         x2 = self.last_texture_change_center_x
         y1 = self.center_y
         y2 = self.last_texture_change_center_y
-        distance = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        # Compare squared distances, no need for a square root every frame
+        distance_squared = (x2 - x1) * (x2 - x1) + (y2 - y1) * (y2 - y1)
         texture_list = []
 
         change_direction = False
@@ -861,7 +922,7 @@ def update_animation(self, delta_time: float = 1/60):
             elif self.state == FACE_DOWN:
                 self.texture = self.walk_down_textures[0]
 
-        elif change_direction or distance >= self.texture_change_distance:
+        elif change_direction or distance_squared >= self.texture_change_distance * self.texture_change_distance:
             self.last_texture_change_center_x = self.center_x
             self.last_texture_change_center_y = self.center_y
 
@@ -13,7 +13,6 @@
 
 import pyglet.gl as gl
 
-import math
 import numpy as np
 
 from PIL import Image
@@ -21,7 +20,6 @@
 from arcade.sprite import Sprite
 from arcade.sprite import get_distance_between_sprites
 
-from arcade.draw_commands import rotate_point
 from arcade.window_commands import get_projection
 from arcade import shader
 from arcade.arcade_types import Point
@@ -81,37 +79,6 @@
 """
 
 
-def _create_rects(rect_list: Iterable[Sprite]) -> List[float]:
-    """
-    Create a vertex buffer for a set of rectangles.
-    """
-
-    v2f = []
-    for shape in rect_list:
-        x1 = -shape.width / 2 + shape.center_x
-        x2 = shape.width / 2 + shape.center_x
-        y1 = -shape.height / 2 + shape.center_y
-        y2 = shape.height / 2 + shape.center_y
-
-        p1 = x1, y1
-        p2 = x2, y1
-        p3 = x2, y2
-        p4 = x1, y2
-
-        if shape.angle:
-            p1 = rotate_point(p1[0], p1[1], shape.center_x, shape.center_y, shape.angle)
-            p2 = rotate_point(p2[0], p2[1], shape.center_x, shape.center_y, shape.angle)
-            p3 = rotate_point(p3[0], p3[1], shape.center_x, shape.center_y, shape.angle)
-            p4 = rotate_point(p4[0], p4[1], shape.center_x, shape.center_y, shape.angle)
-
-        v2f.extend([p1[0], p1[1],
-                   p2[0], p2[1],
-                   p3[0], p3[1],
-                   p4[0], p4[1]])
-
-    return v2f
-
-
 class _SpatialHash:
     """
     Structure for fast collision checking.
@@ -134,10 +101,7 @@ def insert_object_for_box(self, new_object: Sprite):
         Insert a sprite.
         """
         # Get the corners
-        min_x = new_object.left
-        max_x = new_object.right
-        min_y = new_object.bottom
-        max_y = new_object.top
+        min_x, min_y, max_x, max_y = new_object.aabb
 
         # print(f"New - Center: ({new_object.center_x}, {new_object.center_y}), Angle: {new_object.angle}, "
         #       f"Left: {new_object.left}, Right {new_object.right}")
@@ -173,10 +137,7 @@ def remove_object(self, sprite_to_delete: Sprite):
         :param Sprite sprite_to_delete: Pointer to sprite to be removed.
         """
         # Get the corners
-        min_x = sprite_to_delete.left
-        max_x = sprite_to_delete.right
-        min_y = sprite_to_delete.bottom
-        max_y = sprite_to_delete.top
+        min_x, min_y, max_x, max_y = sprite_to_delete.aabb
 
         # print(f"Del - Center: ({sprite_to_delete.center_x}, {sprite_to_delete.center_y}), "
         #       f"Angle: {sprite_to_delete.angle}, Left: {sprite_to_delete.left}, Right {sprite_to_delete.right}")
@@ -218,10 +179,7 @@ def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
 
         """
         # Get the corners
-        min_x = check_object.left
-        max_x = check_object.right
-        min_y = check_object.bottom
-        max_y = check_object.top
+        min_x, min_y, max_x, max_y = check_object.aabb
 
         min_point = (min_x, min_y)
         max_point = (max_x, max_y)
@@ -285,7 +243,14 @@ def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static
         """
         # List of sprites in the sprite list
         self.sprite_list = []
+        # Sprite to position in sprite_list. Which sprites are in it is always
+        # accurate, but after a removal the positions may be stale until
+        # _reindex() runs, which at the latest is when the draw buffer is
+        # rebuilt. Use sprite_list.index() rather than these positions.
         self.sprite_idx = dict()
+        # Number of removals since the positions in sprite_idx were last
+        # rebuilt. Each one can leave the positions after it off by one.
+        self._removed_since_reindex = 0
 
         # Used in drawing optimization via OpenGL
         self.program = None
@@ -299,6 +264,8 @@ def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static
 
         self.array_of_texture_names = []
         self.array_of_images = []
+        # Atlas sub-texture coordinates, by texture name
+        self.texture_coordinates = {}
 
         # Used in collision detection optimization
         self.is_static = is_static
@@ -310,10 +277,14 @@ def __init__(self, use_spatial_hash=False, spatial_hash_cell_size=128, is_static
 
     def append(self, item: T):
         """
-        Add a new sprite to the list.
+        Add a new sprite to the list. Adding a sprite that is already in
+        the list does nothing.
 
         :param Sprite item: Sprite to add to the list.
         """
+        if item in self.sprite_idx:
+            return
+
         idx = len(self.sprite_list)
         self.sprite_list.append(item)
         self.sprite_idx[item] = idx
@@ -339,23 +310,55 @@ def remove(self, item: T):
         Remove a specific sprite from the list.
         :param Sprite item: Item to remove from the list
         """
-        self.sprite_list.remove(item)
-
-        # Rebuild index list
-        self.sprite_idx[item] = dict()
-        for idx, sprite in enumerate(self.sprite_list):
-            self.sprite_idx[sprite] = idx
+        try:
+            idx = self.sprite_idx.pop(item)
+        except KeyError:
+            raise ValueError("Sprite is not in the SpriteList.")
+        if self._removed_since_reindex:
+            # The stored position can only have drifted down, and by no more
+            # than one per removal, so only that window needs searching.
+            idx = self.sprite_list.index(item, max(0, idx - self._removed_since_reindex), idx + 1)
+        del self.sprite_list[idx]
+        item.sprite_lists.remove(self)
+
+        # Rather than re-index the sprites after this one on every removal,
+        # let the positions drift and rebuild them once the search window
+        # above would cost more than a rebuild, or when the draw buffer is.
+        if idx < len(self.sprite_list):
+            self._removed_since_reindex += 1
+            if self._removed_since_reindex ** 2 > len(self.sprite_list):
+                self._reindex()
 
         self.vao = None
         if self.use_spatial_hash:
             self.spatial_hash.remove_object(item)
 
+    def _reindex(self):
+        """ Rebuild the sprite to position lookup. """
+        self.sprite_idx = {sprite: idx for idx, sprite in enumerate(self.sprite_list)}
+        self._removed_since_reindex = 0
+
     def update(self):
         """
         Call the update() method on each sprite in the list.
+
+        For sprites that use the stock ``Sprite.update``, its body is done
+        inline here to save a method call per sprite, and sprites with no
+        velocity or rotation are skipped. Overrides, whether on a subclass or
+        assigned to a single sprite, are always called.
         """
+        stock_update = Sprite.update
         for sprite in self.sprite_list:
-            sprite.update()
+            if type(sprite).update is not stock_update or 'update' in sprite.__dict__:
+                sprite.update()
+                continue
+
+            change_x, change_y = sprite.velocity
+            if change_x or change_y:
+                position = sprite.position
+                sprite.position = [position[0] + change_x, position[1] + change_y]
+            if sprite.change_angle:
+                sprite.angle += sprite.change_angle
 
     def update_animation(self, delta_time: float = 1/60):
         for sprite in self.sprite_list:
@@ -400,6 +403,9 @@ def _calculate_sprite_buffer(self):
         if len(self.sprite_list) == 0:
             return
 
+        if self._removed_since_reindex:
+            self._reindex()
+
         # Loop through each sprite and grab its position, and the texture it will be using.
         array_of_positions = []
         array_of_sizes = []
@@ -408,13 +414,17 @@ def _calculate_sprite_buffer(self):
 
         for sprite in self.sprite_list:
             array_of_positions.append([sprite.center_x, sprite.center_y])
-            array_of_angles.append(math.radians(sprite.angle))
+            array_of_angles.append(sprite.radians)
             size_h = sprite.height / 2
             size_w = sprite.width / 2
             array_of_sizes.append([size_w, size_h])
             array_of_colors.append(sprite.color + (sprite.alpha, ))
 
+        # Sets mirror the name lists, so membership checks don't scan them
+        # once per sprite.
+        old_texture_names = set(self.array_of_texture_names)
         new_array_of_texture_names = []
+        new_texture_names = set()
         new_array_of_images = []
         new_texture = False
         if self.array_of_images is None:
@@ -430,11 +440,12 @@ def _calculate_sprite_buffer(self):
                 raise Exception("Error: Attempt to draw a sprite without a texture set.")
 
             name_of_texture_to_check = sprite.texture.name
-            if name_of_texture_to_check not in self.array_of_texture_names:
+            if name_of_texture_to_check not in old_texture_names:
                 new_texture = True
                 # print("New because of ", name_of_texture_to_check)
 
-            if name_of_texture_to_check not in new_array_of_texture_names:
+            if name_of_texture_to_check not in new_texture_names:
+                new_texture_names.add(name_of_texture_to_check)
                 new_array_of_texture_names.append(name_of_texture_to_check)
                 image = sprite.texture.image
                 new_array_of_images.append(image)
@@ -447,7 +458,7 @@ def _calculate_sprite_buffer(self):
         if new_texture:
             # Add back in any old textures. Chances are we'll need them.
             for index, old_texture_name in enumerate(self.array_of_texture_names):
-                if old_texture_name not in new_array_of_texture_names and self.array_of_images is not None:
+                if old_texture_name not in new_texture_names and self.array_of_images is not None:
                     new_array_of_texture_names.append(old_texture_name)
                     image = self.array_of_images[index]
                     new_array_of_images.append(image)
@@ -501,10 +512,10 @@ def _calculate_sprite_buffer(self):
 
         # Go through each sprite and pull from the coordinate list, the proper
         # coordinates for that sprite's image.
+        self.texture_coordinates = dict(zip(self.array_of_texture_names, tex_coords))
         array_of_sub_tex_coords = []
         for sprite in self.sprite_list:
-            index = self.array_of_texture_names.index(sprite.texture.name)
-            array_of_sub_tex_coords.append(tex_coords[index])
+            array_of_sub_tex_coords.append(self.texture_coordinates[sprite.texture.name])
 
         # Create numpy array with info on location and such
         buffer_type = np.dtype([('position', '2f4'), ('angle', 'f4'), ('size', '2f4'),
@@ -569,17 +580,32 @@ def _update_positions(self):
 
         for i, sprite in enumerate(self.sprite_list):
             self.sprite_data[i]['position'] = [sprite.center_x, sprite.center_y]
-            self.sprite_data[i]['angle'] = math.radians(sprite.angle)
+            self.sprite_data[i]['angle'] = sprite.radians
             self.sprite_data[i]['size'] = [sprite.width / 2, sprite.height / 2]
             self.sprite_data[i]['color'] = sprite.color + (sprite.alpha, )
 
-    def update_texture(self, _sprite):
+    def update_texture(self, sprite: Sprite):
         """ Make sure we update the texture for this sprite for the next batch
-        drawing"""
+        drawing.
+
+        If the new texture is already in the atlas, only this sprite's entry
+        is updated. Otherwise the atlas and buffer have to be rebuilt. Static
+        lists always rebuild, as their buffer isn't re-sent on each draw.
+        """
         if self.vao is None:
             return
 
-        self._calculate_sprite_buffer()
+        tex_coords = None
+        if sprite.texture is not None and not self.is_static:
+            tex_coords = self.texture_coordinates.get(sprite.texture.name)
+
+        if tex_coords is None:
+            self._calculate_sprite_buffer()
+            return
+
+        i = self.sprite_idx[sprite]
+        self.sprite_data[i]['sub_tex_coords'] = tex_coords
+        self.sprite_data[i]['size'] = [sprite.width / 2, sprite.height / 2]
 
     def update_position(self, sprite: Sprite):
         """
@@ -595,7 +621,7 @@ def update_position(self, sprite: Sprite):
         i = self.sprite_idx[sprite]
 
         self.sprite_data[i]['position'] = [sprite.center_x, sprite.center_y]
-        self.sprite_data[i]['angle'] = math.radians(sprite.angle)
+        self.sprite_data[i]['angle'] = sprite.radians
         self.sprite_data[i]['size'] = [sprite.width / 2, sprite.height / 2]
         self.sprite_data[i]['color'] = sprite.color + (sprite.alpha, )
 
@@ -624,7 +650,7 @@ def update_angle(self, sprite: Sprite):
             return
 
         i = self.sprite_idx[sprite]
-        self.sprite_data[i]['angle'] = math.radians(sprite.angle)
+        self.sprite_data[i]['angle'] = sprite.radians
 
     def draw(self):
         """ Draw this list of sprites. """
@@ -671,12 +697,17 @@ def __iter__(self) -> Iterable[T]:
     def __getitem__(self, i):
         return self.sprite_list[i]
 
+    def __contains__(self, item: T) -> bool:
+        """ Return True if the sprite is in this list. """
+        return item in self.sprite_idx
+
     def pop(self) -> Sprite:
         """
         Pop off the last sprite in the list.
         """
-        self.program = None
-        return self.sprite_list.pop()
+        item = self.sprite_list[-1]
+        self.remove(item)
+        return item
 
 
 def get_closest_sprite(sprite: Sprite, sprite_list: SpriteList) -> Optional[Tuple[Sprite, float]]:
@@ -1,3 +1,4 @@
+import math
 import os
 import arcade
 
@@ -89,3 +90,65 @@ def test_sprite_collides_with_list():
     player.center_x = 5
     result = player.collides_with_list(cast(list, coins))
     assert len(result) == 2, "Should collide with two"
+
+
+def test_sprite_points_follow_changes():
+    sprite = arcade.Sprite(center_x=0, center_y=0)
+    sprite.width = 10
+    sprite.height = 20
+
+    assert sprite.get_points() == ((-5, -10), (5, -10), (5, 10), (-5, 10))
+
+    sprite.angle = 90
+    assert sprite.get_points() == ((10, -5), (10, 5), (-10, 5), (-10, -5))
+
+    sprite.set_points(((0, 0), (1, 0), (1, 1)))
+    assert sprite.get_points() == ((0, 0), (1, 0), (1, 1))
+
+
+def test_sprite_edges():
+    sprite = arcade.Sprite(center_x=50, center_y=100)
+    sprite.width = 20
+    sprite.height = 40
+
+    assert (sprite.left, sprite.right, sprite.bottom, sprite.top) == (40, 60, 80, 120)
+
+    sprite.angle = 90
+    assert (sprite.left, sprite.right, sprite.bottom, sprite.top) == (30, 70, 90, 110)
+
+    sprite.angle = 0
+    sprite.left = 0
+    sprite.bottom = 0
+    assert sprite.position == [10, 20]
+
+
+def test_sprite_aabb():
+    sprite = arcade.Sprite(center_x=50, center_y=100)
+    sprite.width = 20
+    sprite.height = 40
+    assert sprite.aabb == (40, 80, 60, 120)
+
+    sprite.center_x = 0
+    assert sprite.aabb == (-10, 80, 10, 120)
+
+    sprite.angle = 90
+    assert sprite.aabb == (-20, 90, 20, 110)
+
+    other = arcade.Sprite(center_x=30, center_y=100)
+    other.width = 20
+    other.height = 20
+    assert sprite.collides_with_sprite(other) is False
+    other.center_x = 25
+    assert sprite.collides_with_sprite(other) is True
+
+
+def test_sprite_radians():
+    sprite = arcade.Sprite()
+    assert sprite.radians == 0
+
+    sprite.angle = 180
+    assert sprite.radians == math.pi
+
+    sprite.radians = math.pi / 2
+    assert sprite.angle == 90
+    assert sprite.radians == math.pi / 2
@@ -0,0 +1,250 @@
+import pytest
+import PIL.Image
+import arcade
+
+
+def test_update_moves_only_moving_sprites():
+    sprite_list = arcade.SpriteList()
+
+    still = arcade.Sprite(center_x=10, center_y=20)
+    sprite_list.append(still)
+
+    mover = arcade.Sprite(center_x=10, center_y=20)
+    mover.change_x = 2
+    mover.change_y = -1
+    mover.change_angle = 5
+    sprite_list.append(mover)
+
+    sprite_list.update()
+
+    assert still.position == [10, 20]
+    assert still.angle == 0
+    assert mover.position == [12, 19]
+    assert mover.angle == 5
+
+
+def test_update_calls_overridden_update():
+    class CountingSprite(arcade.Sprite):
+        def __init__(self):
+            super().__init__()
+            self.update_count = 0
+
+        def update(self):
+            self.update_count += 1
+
+    sprite = CountingSprite()
+    sprite_list = arcade.SpriteList()
+    sprite_list.append(sprite)
+
+    sprite_list.update()
+    sprite_list.update()
+
+    assert sprite.update_count == 2
+
+
+def test_update_calls_instance_update():
+    sprite = arcade.Sprite()
+    calls = []
+    sprite.update = lambda: calls.append(sprite)
+    sprite_list = arcade.SpriteList()
+    sprite_list.append(sprite)
+
+    sprite_list.update()
+
+    assert calls == [sprite]
+
+def test_kill_removes_from_all_lists():
+    list_one = arcade.SpriteList()
+    list_two = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.Sprite(center_x=i * 10) for i in range(5)]
+    for sprite in sprites:
+        list_one.append(sprite)
+        list_two.append(sprite)
+
+    sprites[1].kill()
+
+    assert sprites[1] not in list_one
+    assert sprites[1] not in list_two
+    assert sprites[1].sprite_lists == []
+    assert list(list_one) == [sprites[0]] + sprites[2:]
+    assert list(list_two) == [sprites[0]] + sprites[2:]
+
+    # Index is kept up to date for the sprites that shifted down
+    list_one.remove(sprites[4])
+    assert list(list_one) == [sprites[0], sprites[2], sprites[3]]
+    assert sprites[3] in list_one
+
+
+def test_append_twice():
+    sprite_list = arcade.SpriteList()
+    sprite = arcade.Sprite()
+
+    sprite_list.append(sprite)
+    sprite_list.append(sprite)
+
+    assert len(sprite_list) == 1
+    assert sprite.sprite_lists == [sprite_list]
+
+    sprite.kill()
+    assert len(sprite_list) == 0
+    assert sprite.sprite_lists == []
+
+
+def test_set_texture_keeps_spatial_hash():
+    small_1 = arcade.Texture("small_1", PIL.Image.new("RGBA", (10, 10)))
+    small_2 = arcade.Texture("small_2", PIL.Image.new("RGBA", (10, 10)))
+    large = arcade.Texture("large", PIL.Image.new("RGBA", (300, 300)))
+
+    sprite = arcade.Sprite(center_x=5, center_y=5)
+    sprite.textures = [small_1, small_2, large]
+    sprite.set_texture(0)
+
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    sprite_list.append(sprite)
+
+    sprite.set_texture(1)
+    assert sprite.texture is small_2
+    assert (sprite.width, sprite.height) == (10, 10)
+    assert arcade.get_sprites_at_point((5, 5), sprite_list) == [sprite]
+
+    sprite.set_texture(2)
+    assert (sprite.width, sprite.height) == (300, 300)
+    assert sprite.aabb == (-145, -145, 155, 155)
+    assert arcade.get_sprites_at_point((150, 150), sprite_list) == [sprite]
+
+
+def test_remove_many_keeps_order():
+    sprite_list = arcade.SpriteList()
+    sprites = [arcade.Sprite(center_x=i) for i in range(100)]
+    for sprite in sprites:
+        sprite_list.append(sprite)
+
+    for sprite in sprites[::3]:
+        sprite_list.remove(sprite)
+    new_sprite = arcade.Sprite()
+    sprite_list.append(new_sprite)
+    for sprite in sprites[1::3]:
+        sprite.kill()
+
+    expected = sprites[2::3] + [new_sprite]
+    assert list(sprite_list) == expected
+
+    sprite_list._reindex()
+    assert [sprite_list.sprite_idx[sprite] for sprite in expected] == list(range(len(expected)))
+
+
+def test_remove_missing_sprite():
+    sprite_list = arcade.SpriteList()
+    with pytest.raises(ValueError):
+        sprite_list.remove(arcade.Sprite())
+
+
+def test_pop_clears_spatial_hash():
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    sprite = arcade.Sprite(center_x=5, center_y=5)
+    sprite.width = 10
+    sprite.height = 10
+    sprite_list.append(sprite)
+
+    assert sprite_list.pop() is sprite
+    assert len(sprite_list) == 0
+    assert sprite not in sprite_list
+    assert sprite.sprite_lists == []
+    assert arcade.get_sprites_at_point((5, 5), sprite_list) == []
+
+
+def test_set_points_keeps_spatial_hash():
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    sprite = arcade.Sprite(center_x=150, center_y=150)
+    sprite.width = 300
+    sprite.height = 300
+    sprite_list.append(sprite)
+
+    sprite.points = ((-10, -10), (10, -10), (10, 10), (-10, 10))
+    assert arcade.get_sprites_at_point((150, 150), sprite_list) == [sprite]
+
+    sprite.kill()
+    assert len(sprite_list) == 0
+    assert all(len(bucket) == 0 for bucket in sprite_list.spatial_hash.contents.values())
+
+    player = arcade.Sprite(center_x=20, center_y=20)
+    player.width = 10
+    player.height = 10
+    assert arcade.check_for_collision_with_list(player, sprite_list) == []
+
+def test_sprite_attributes_are_slots():
+    # Attributes set in __init__ need to be listed in __slots__, otherwise
+    # they silently end up in the per-instance __dict__.
+    for sprite_class in (arcade.Sprite, arcade.AnimatedTimeSprite,
+                         arcade.AnimatedTimeBasedSprite, arcade.AnimatedWalkingSprite):
+        assert sprite_class().__dict__ == {}
+
+
+@pytest.fixture
+def stub_gl(monkeypatch):
+    # Building the sprite buffer only needs these to return something; no
+    # window or GL context is required.
+    class GLObject:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(arcade.sprite_list.shader, "texture", GLObject)
+    monkeypatch.setattr(arcade.sprite_list.shader, "buffer", GLObject)
+    monkeypatch.setattr(arcade.sprite_list.shader, "BufferDescription", GLObject)
+    monkeypatch.setattr(arcade.sprite_list.shader, "vertex_array", GLObject)
+
+
+def _make_textured_list(textures, count, is_static=False):
+    sprite_list = arcade.SpriteList(is_static=is_static)
+    for i in range(count):
+        sprite = arcade.Sprite(center_x=i * 10, center_y=i * 5)
+        sprite.textures = list(textures)
+        sprite.set_texture(i % len(textures))
+        sprite_list.append(sprite)
+    sprite_list._calculate_sprite_buffer()
+    return sprite_list
+
+
+def test_set_texture_in_atlas_updates_one_sprite(stub_gl):
+    textures = [arcade.Texture(f"frame_{i}", PIL.Image.new("RGBA", (4 + i, 4 + i))) for i in range(4)]
+    sprite_list = _make_textured_list(textures, 20)
+    sprite_data_buf = sprite_list.sprite_data_buf
+
+    for i, sprite in enumerate(sprite_list):
+        sprite.set_texture((i * 3 + 1) % len(textures))
+
+    # Every texture was already in the atlas, so nothing was rebuilt
+    assert sprite_list.sprite_data_buf is sprite_data_buf
+
+    swapped = sprite_list.sprite_data.tobytes()
+    sprite_list._calculate_sprite_buffer()
+    assert sprite_list.sprite_data.tobytes() == swapped
+
+
+def test_set_texture_not_in_atlas_rebuilds(stub_gl):
+    textures = [arcade.Texture(f"frame_{i}", PIL.Image.new("RGBA", (4 + i, 4 + i))) for i in range(2)]
+    sprite_list = _make_textured_list(textures, 5)
+    sprite_data_buf = sprite_list.sprite_data_buf
+
+    new_texture = arcade.Texture("new_frame", PIL.Image.new("RGBA", (8, 8)))
+    sprite = sprite_list[2]
+    sprite.textures.append(new_texture)
+    sprite.set_texture(len(sprite.textures) - 1)
+
+    assert sprite_list.sprite_data_buf is not sprite_data_buf
+    assert "new_frame" in sprite_list.texture_coordinates
+    assert list(sprite_list.sprite_data[2]['sub_tex_coords']) == \
+        pytest.approx(sprite_list.texture_coordinates["new_frame"])
+
+
+def test_set_texture_static_list_rebuilds(stub_gl):
+    textures = [arcade.Texture(f"frame_{i}", PIL.Image.new("RGBA", (4 + i, 4 + i))) for i in range(2)]
+    sprite_list = _make_textured_list(textures, 5, is_static=True)
+    sprite_data_buf = sprite_list.sprite_data_buf
+
+    sprite_list[0].set_texture(1)
+
+    # A static buffer isn't re-sent on draw, so it has to be rebuilt
+    assert sprite_list.sprite_data_buf is not sprite_data_buf
+    assert list(sprite_list.sprite_data[0]['sub_tex_coords']) == \
+        pytest.approx(sprite_list.texture_coordinates["frame_1"])